@@ -0,0 +1,148 @@
+"""
+cardStatX - Football Card Data Ingestion System
+Author: Samuel Stockstrom
+License: CC BY-NC 4.0 (https://creativecommons.org/licenses/by-nc/4.0/)
+This work is licensed under a Creative Commons Attribution-NonCommercial 4.0 International License.
+"""
+
+# Only cheap stdlib modules are imported here. Each subcommand imports its own
+# subsystem (cloudscraper, bs4, lxml, aiohttp, quart, ...) when it runs, so cron
+# jobs and container restarts only pay for what they actually use.
+import argparse
+import sys
+import time
+import os
+
+# Module each subcommand loads, used by `bench` to measure cold-start cost
+SUBSYSTEMS = {
+    'scrape': 'scraper',
+    'ingest': 'ingestor',
+    'serve': 'web',
+    'compact': 'syncdatabase',
+    'snapshot': 'snapshot',
+}
+
+def cmd_scrape(args):
+    from scraper import main
+    
+    main()
+
+def cmd_ingest(args):
+    from ingestor import main
+    import asyncio
+    
+    if not asyncio.run(main(concurrency_limit=args.concurrency, notify_port=args.notify_port)):
+        return 1
+
+def cmd_serve(args):
+    from web import main
+    
+    main(host=args.host, port=args.port, debug=args.debug, notify_port=args.notify_port)
+
+def cmd_compact(args):
+    from logging_setup import setup_logging
+    from syncdatabase import SyncCardDatabase
+    
+    setup_logging()
+    
+    db = SyncCardDatabase(args.db)
+    if not db.compact():
+        return 1
+    
+    print(f"Compacted {args.db}")
+
+def cmd_snapshot(args):
+    from logging_setup import setup_logging
+    from snapshot import publish_snapshot
+    
+    setup_logging()
+    
+    if not publish_snapshot(args.db, args.output):
+        return 1
+    
+    print(f"Published {args.output}")
+
+def time_import(code: str, runs: int) -> float:
+    """Median wall time in milliseconds for a fresh interpreter to run code"""
+    
+    import statistics
+    import subprocess
+    
+    here = os.path.dirname(os.path.abspath(__file__))
+    samples = []
+    
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, '-c', code], cwd=here, capture_output=True)
+        elapsed = (time.perf_counter() - start) * 1000
+        
+        if result.returncode != 0:
+            error = result.stderr.decode(errors='replace').strip().splitlines()
+            print(f"{code!r} failed: {error[-1] if error else result.returncode}", file=sys.stderr)
+            return float('nan')
+        
+        samples.append(elapsed)
+    
+    return statistics.median(samples)
+
+def print_timing(target: str, elapsed: float, baseline: float):
+    import math
+    
+    if math.isnan(elapsed):
+        print(f"{target:<12} {'import failed':>23}")
+        return
+    
+    print(f"{target:<12} {elapsed:>10.1f} {elapsed - baseline:>12.1f}")
+
+def cmd_bench(args):
+    baseline = time_import('pass', args.runs)
+    cli = time_import('import cardstatx', args.runs)
+    
+    print(f"{'target':<12} {'median ms':>10} {'over python':>12}")
+    print(f"{'python':<12} {baseline:>10.1f} {'':>12}")
+    print_timing('cardstatx', cli, baseline)
+    
+    for command, module in SUBSYSTEMS.items():
+        print_timing(command, time_import(f'import {module}', args.runs), baseline)
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='cardstatx', description='cardStatX command line interface')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    scrape = subparsers.add_parser('scrape', help='scrape the card catalog from TCDB')
+    scrape.set_defaults(func=cmd_scrape)
+    
+    ingest = subparsers.add_parser('ingest', help='ingest eBay listings for every card')
+    ingest.add_argument('--concurrency', type=int, default=3, help='concurrent eBay searches (default: 3)')
+    ingest.add_argument('--notify-port', type=int, default=5001, help='local UDP port to announce new snapshots on (default: 5001)')
+    ingest.set_defaults(func=cmd_ingest)
+    
+    serve = subparsers.add_parser('serve', help='run the web API')
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=5000)
+    serve.add_argument('--debug', action='store_true')
+    serve.add_argument('--notify-port', type=int, default=5001, help='local UDP port to listen for new snapshots on (default: 5001)')
+    serve.set_defaults(func=cmd_serve)
+    
+    compact = subparsers.add_parser('compact', help='vacuum and analyze the card database')
+    compact.add_argument('--db', default='data/cards.db')
+    compact.set_defaults(func=cmd_compact)
+    
+    snapshot = subparsers.add_parser('snapshot', help='publish a read-only snapshot for the web API')
+    snapshot.add_argument('--db', default='data/cards.db')
+    snapshot.add_argument('--output', default='data/cards.snapshot.db')
+    snapshot.set_defaults(func=cmd_snapshot)
+    
+    bench = subparsers.add_parser('bench', help='measure cold-start time of each subcommand')
+    bench.add_argument('--runs', type=int, default=5, help='interpreter launches per target (default: 5)')
+    bench.set_defaults(func=cmd_bench)
+    
+    return parser
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    
+    return args.func(args) or 0
+
+if __name__ == '__main__':
+    sys.exit(main())
\ No newline at end of file
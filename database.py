@@ -110,6 +110,15 @@ class CardDatabase:
                 
                 return {row[0]: {row[1], row[2], row[3], row[4], row[5]} for row in rows}
             
+    async def get_listing_prices(self, card_id: str) -> Dict[str, float]:
+        """Get a card's stored listings as a dictionary {listing id: price}"""
+        
+        async with aiosqlite.connect(self.db_path) as db:
+            async with db.execute("SELECT id, price FROM listings WHERE card_id = ?", (card_id,)) as cursor:
+                rows = await cursor.fetchall()
+                
+                return {row[0]: row[1] for row in rows}
+            
     async def get_card_averages(self, card_id: str) -> Optional[Dict[str, float]]:
         """Calculate price averages for a card over different time periods"""
         
@@ -6,9 +6,10 @@ This work is licensed under a Creative Commons Attribution-NonCommercial 4.0 Int
 """
 
 from logging_setup import setup_logging
+from snapshot import publish_snapshot, SNAPSHOT_PATH
+from notify import ChangeNotifier, NOTIFY_PORT
 from database import CardDatabase
-from typing import Optional
-import constants
+from typing import Optional, Set
 import asyncio
 import aiohttp
 import logging
@@ -19,6 +20,7 @@ class AsyncCardIngestor:
     def __init__(self, db: CardDatabase):
         self.db = db
         self.session = None
+        self.changed: Set[str] = set()
     
     async def __aenter__(self):
         self.session = aiohttp.ClientSession()
@@ -31,6 +33,8 @@ class AsyncCardIngestor:
     async def search_ebay(self, keyword: str) -> Optional[dict]:
         """Search eBay API asynchronously"""
         
+        import constants  # imported here so read-only work does not need a token
+        
         url = f"https://api.ebay.com/buy/browse/v1/item_summary/search?q={keyword}&category_ids=261328&limit=200"
         
         headers = {
@@ -97,13 +101,20 @@ class AsyncCardIngestor:
             if not filtered_items:
                 return 0
             
+            known_prices = await self.db.get_listing_prices(card_id)
+            
             listings_added = 0
+            changed = False
             for listing_id, (title, condition, price, listing_date) in filtered_items.items():
                 success = await self.db.add_listing(
                     listing_id, card_id, title, condition, price, listing_date
                 )
                 if success:
                     listings_added += 1
+                    changed = changed or known_prices.get(listing_id) != price
+            
+            if changed:
+                self.changed.add(card_id)
             
             logger.info(f"Processed {card_name} ({card_id}) - added {listings_added} listings")
             return listings_added
@@ -149,16 +160,35 @@ class AsyncCardIngestor:
         
         logger.info(f"Completed processing all cards - total {total_listings} listings added")
 
-async def main():
+async def main(concurrency_limit: int = 3, notify_port: int = NOTIFY_PORT) -> bool:
     
     setup_logging()
+    
+    # checked up front so a missing token stops the run instead of failing every card
+    try:
+        import constants
+    except ImportError:
+        logger.error("constants.py not found - copy constants.py.example and set OAUTH_TOKEN")
+        return False
+    
+    if not constants.OAUTH_TOKEN:
+        logger.error("OAUTH_TOKEN is empty in constants.py")
+        return False
 
     db = CardDatabase()
     
     await db.initialize()
     
     async with AsyncCardIngestor(db) as ingestor:
-        await ingestor.process_all_cards(concurrency_limit=3)
+        await ingestor.process_all_cards(concurrency_limit=concurrency_limit)
+    
+    # changed cards travel inside the snapshot, the notifier only wakes the web tier
+    if await asyncio.to_thread(publish_snapshot, db.db_path, SNAPSHOT_PATH, ingestor.changed):
+        notifier = ChangeNotifier(port=notify_port)
+        notifier.notify()
+        notifier.close()
+    
+    return True
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
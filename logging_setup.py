@@ -29,6 +29,7 @@ LOGGING_CONFIG = {
             'filename': 'logs/ingestor.log',
             'backupCount': 3,
             'encoding': 'utf-8',
+            'delay': True,        # only create the file once something is logged
         },
         # Handler for web
         'web': {
@@ -38,6 +39,7 @@ LOGGING_CONFIG = {
             'filename': 'logs/web.log',
             'backupCount': 3,
             'encoding': 'utf-8',
+            'delay': True,        # only create the file once something is logged
         },
         # Handler for scraper
         'scraper': {
@@ -47,6 +49,7 @@ LOGGING_CONFIG = {
             'filename': 'logs/scraper.log',
             'backupCount': 3,
             'encoding': 'utf-8',
+            'delay': True,        # only create the file once something is logged
         },
         # Handler for async database
         'database': {
@@ -56,6 +59,7 @@ LOGGING_CONFIG = {
             'filename': 'logs/database.log',
             'backupCount': 3,
             'encoding': 'utf-8',
+            'delay': True,        # only create the file once something is logged
         },
         # Handler for sync database
         'sync_database': {
@@ -65,6 +69,27 @@ LOGGING_CONFIG = {
             'filename': 'logs/sync_database.log',
             'backupCount': 3,
             'encoding': 'utf-8',
+            'delay': True,        # only create the file once something is logged
+        },
+        # Handler for read-only snapshots
+        'snapshot': {
+            'class': 'logging.handlers.RotatingFileHandler',
+            'level': 'DEBUG',
+            'formatter': 'standard',
+            'filename': 'logs/snapshot.log',
+            'backupCount': 3,
+            'encoding': 'utf-8',
+            'delay': True,        # only create the file once something is logged
+        },
+        # Handler for change notifications
+        'notify': {
+            'class': 'logging.handlers.RotatingFileHandler',
+            'level': 'DEBUG',
+            'formatter': 'standard',
+            'filename': 'logs/notify.log',
+            'backupCount': 3,
+            'encoding': 'utf-8',
+            'delay': True,        # only create the file once something is logged
         }
     },
 
@@ -98,6 +123,18 @@ LOGGING_CONFIG = {
             'handlers': ['sync_database'],
             'level': 'DEBUG',
             'propagate': False,   # avoid also sending to root
+        },
+        # Logger for read-only snapshots
+        'snapshot': {
+            'handlers': ['snapshot'],
+            'level': 'DEBUG',
+            'propagate': False,   # avoid also sending to root
+        },
+        # Logger for change notifications
+        'notify': {
+            'handlers': ['notify'],
+            'level': 'DEBUG',
+            'propagate': False,   # avoid also sending to root
         }
     }
 }
@@ -0,0 +1,182 @@
+"""
+cardStatX - Football Card Data Ingestion System
+Author: Samuel Stockstrom
+License: CC BY-NC 4.0 (https://creativecommons.org/licenses/by-nc/4.0/)
+This work is licensed under a Creative Commons Attribution-NonCommercial 4.0 International License.
+"""
+
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Set
+import asyncio
+import logging
+import socket
+import json
+
+logger = logging.getLogger('notify')
+
+# Local UDP address the ingestor wakes the web tier on after publishing a snapshot.
+# The changed cards themselves travel inside the snapshot, so a lost datagram only
+# delays updates until the next request opens the new snapshot.
+NOTIFY_HOST = "127.0.0.1"
+NOTIFY_PORT = 5001
+
+class ChangeNotifier:
+    """Fire-and-forget announcements that a new snapshot was published"""
+    
+    def __init__(self, host: str = NOTIFY_HOST, port: int = NOTIFY_PORT):
+        
+        self.address = (host, port)
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setblocking(False)
+    
+    def notify(self):
+        """Announce a newly published snapshot, ignoring whether anyone is listening"""
+        
+        try:
+            self.sock.sendto(b'published', self.address)
+        
+        except OSError as e:
+            logger.debug(f"Error announcing snapshot: {e}")
+    
+    def close(self):
+        self.sock.close()
+
+class Subscription:
+    """Latest undelivered event per card for one subscriber"""
+    
+    def __init__(self, card_ids: Iterable[str]):
+        
+        self.card_ids = set(card_ids)
+        self.latest: Dict[str, str] = {}
+        self.ready = asyncio.Event()
+    
+    def offer(self, card_id: str, event: str):
+        """Queue an event, replacing any undelivered one for the same card"""
+        
+        self.latest[card_id] = event
+        self.ready.set()
+    
+    async def next(self, timeout: float) -> List[str]:
+        """Wait for undelivered events, returning an empty list on timeout"""
+        
+        try:
+            await asyncio.wait_for(self.ready.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return []
+        
+        # slow clients skip intermediate values but always get each card's latest
+        events = list(self.latest.values())
+        self.latest.clear()
+        self.ready.clear()
+        
+        return events
+
+class ChangeFeed(asyncio.DatagramProtocol):
+    """Fans out fresh stats for changed cards to the subscribers of those cards"""
+    
+    def __init__(self, load_stats: Callable[[str], Awaitable[Optional[Dict[str, float]]]], refresh: Callable[[], Awaitable]):
+        
+        self.load_stats = load_stats
+        self.refresh = refresh
+        self.subscribers: Dict[str, Set[Subscription]] = {}
+        self.pending: Set[str] = set()
+        self.stale: Set[str] = set()
+        self.tasks: Set[asyncio.Task] = set()
+        self.transport = None
+    
+    async def start(self, host: str = NOTIFY_HOST, port: int = NOTIFY_PORT) -> bool:
+        """Start listening for snapshot announcements, returning False if the port is unavailable"""
+        
+        loop = asyncio.get_running_loop()
+        
+        try:
+            await loop.create_datagram_endpoint(lambda: self, local_addr=(host, port))
+        
+        except OSError as e:
+            logger.error(f"Error listening for card changes on {host}:{port}, push updates disabled: {e}")
+            return False
+        
+        logger.info(f"Listening for card changes on {host}:{port}")
+        return True
+    
+    def stop(self):
+        if self.transport is not None:
+            self.transport.close()
+    
+    def connection_made(self, transport):
+        self.transport = transport
+    
+    def datagram_received(self, data: bytes, addr):
+        # opening the new snapshot hands its changed cards to announce()
+        self.spawn(self.refresh())
+    
+    def announce(self, card_ids: Set[str]):
+        """Push fresh stats for the watched cards among those that changed"""
+        
+        # cards nobody watches cost nothing, and repeated announcements for
+        # the same card are collapsed into as few stats lookups as possible
+        if len(card_ids) > len(self.subscribers):
+            watched = [card_id for card_id in self.subscribers if card_id in card_ids]
+        else:
+            watched = [card_id for card_id in card_ids if card_id in self.subscribers]
+        
+        for card_id in watched:
+            if card_id in self.pending:
+                self.stale.add(card_id)
+                continue
+            
+            self.pending.add(card_id)
+            self.spawn(self.publish(card_id))
+    
+    def spawn(self, coro):
+        task = asyncio.ensure_future(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+    
+    async def publish(self, card_id: str):
+        """Load a card's stats once and hand the same event to every subscriber"""
+        
+        try:
+            while True:
+                self.stale.discard(card_id)
+                averages = await self.load_stats(card_id)
+                
+                if averages is not None:
+                    event = encode_event(card_id, averages)
+                    
+                    for subscription in self.subscribers.get(card_id, ()):
+                        subscription.offer(card_id, event)
+                
+                # the card changed again while its stats were loading
+                if card_id not in self.stale:
+                    break
+        
+        except Exception as e:
+            logger.error(f"Error loading stats for card {card_id}: {e}")
+        
+        finally:
+            self.pending.discard(card_id)
+            self.stale.discard(card_id)
+    
+    def subscribe(self, card_ids: Iterable[str]) -> Subscription:
+        subscription = Subscription(card_ids)
+        
+        for card_id in subscription.card_ids:
+            self.subscribers.setdefault(card_id, set()).add(subscription)
+        
+        return subscription
+    
+    def unsubscribe(self, subscription: Subscription):
+        for card_id in subscription.card_ids:
+            subscriptions = self.subscribers.get(card_id)
+            
+            if subscriptions is None:
+                continue
+            
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self.subscribers[card_id]
+
+def encode_event(card_id: str, averages: Dict[str, float]) -> str:
+    """Format a card's averages as a server-sent event"""
+    
+    return f"event: average\ndata: {json.dumps({'id': card_id, 'average': averages})}\n\n"
\ No newline at end of file
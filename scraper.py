@@ -14,8 +14,6 @@ import hashlib
 import logging
 import bs4
 
-setup_logging()
-
 logger = logging.getLogger('scraper')
 
 BASEURL = "https://www.tcdb.com"
@@ -123,10 +121,15 @@ def update_sets(year_catalog: dict[str, dict[str, dict[str, str]]]):
     
     return total_cards_processed
 
-if __name__ == "__main__":
+def main():
+    
+    setup_logging()
     
     db = SyncCardDatabase()
     db.initialize()
     
     catalog = update_catalog()
-    update_sets(catalog)
\ No newline at end of file
+    update_sets(catalog)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
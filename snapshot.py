@@ -0,0 +1,210 @@
+"""
+cardStatX - Football Card Data Ingestion System
+Author: Samuel Stockstrom
+License: CC BY-NC 4.0 (https://creativecommons.org/licenses/by-nc/4.0/)
+This work is licensed under a Creative Commons Attribution-NonCommercial 4.0 International License.
+"""
+
+from typing import Callable, Dict, Iterable, Optional, Set
+from datetime import timedelta
+from datetime import datetime
+import aiosqlite
+import asyncio
+import sqlite3
+import logging
+import os
+
+logger = logging.getLogger('snapshot')
+
+SNAPSHOT_PATH = "data/cards.snapshot.db"
+
+MMAP_SIZE = 256 * 1024 * 1024
+
+def publish_snapshot(db_path: str = "data/cards.db", snapshot_path: str = SNAPSHOT_PATH, changed_cards: Iterable[str] = ()) -> bool:
+    """Copy the live database into a read-only snapshot with precomputed stats and the run's changed cards"""
+    
+    tmp_path = snapshot_path + ".tmp"
+    
+    try:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        
+        # read-only so a missing source fails instead of creating an empty database
+        source = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        target = sqlite3.connect(tmp_path)
+        
+        try:
+            source.backup(target)
+            
+            now = datetime.utcnow()
+            
+            # listing_date is an ISO 8601 string, so cutoffs compare lexically
+            cutoffs = {
+                'week': (now - timedelta(weeks=1)).isoformat(timespec='milliseconds') + 'Z',
+                'month': (now - timedelta(days=30)).isoformat(timespec='milliseconds') + 'Z',
+                'year': (now - timedelta(days=365)).isoformat(timespec='milliseconds') + 'Z',
+            }
+            
+            target.execute("""
+                CREATE TABLE card_stats (
+                    card_id TEXT PRIMARY KEY,
+                    week REAL NOT NULL,
+                    month REAL NOT NULL,
+                    year REAL NOT NULL
+                ) WITHOUT ROWID
+            """)
+            
+            target.execute("""
+                INSERT INTO card_stats (card_id, week, month, year)
+                SELECT card_id,
+                    COALESCE(ROUND(AVG(CASE WHEN listing_date >= :week THEN price END), 2), 0.0),
+                    COALESCE(ROUND(AVG(CASE WHEN listing_date >= :month THEN price END), 2), 0.0),
+                    COALESCE(ROUND(AVG(CASE WHEN listing_date >= :year THEN price END), 2), 0.0)
+                FROM listings
+                WHERE currency = 'USD'
+                GROUP BY card_id
+            """, cutoffs)
+            
+            target.execute("""
+                CREATE INDEX IF NOT EXISTS idx_card_name ON cards(name)
+            """)
+            
+            target.execute("""
+                CREATE TABLE snapshot_info (
+                    computed_at TEXT NOT NULL
+                )
+            """)
+            
+            target.execute("INSERT INTO snapshot_info (computed_at) VALUES (?)", (now.isoformat(),))
+            
+            target.execute("""
+                CREATE TABLE changed_cards (
+                    card_id TEXT PRIMARY KEY
+                ) WITHOUT ROWID
+            """)
+            
+            target.executemany("INSERT INTO changed_cards (card_id) VALUES (?)", ((card_id,) for card_id in changed_cards))
+            
+            target.commit()
+            target.execute("PRAGMA journal_mode = DELETE")
+        
+        finally:
+            target.close()
+            source.close()
+        
+        # readers still holding the old file keep reading it until they reopen
+        os.replace(tmp_path, snapshot_path)
+        
+        logger.info(f"Published snapshot {snapshot_path} from {db_path}")
+        return True
+    
+    except Exception as e:
+        logger.error(f"Error publishing snapshot {snapshot_path}: {e}")
+        
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        
+        return False
+
+class SnapshotReader:
+    def __init__(self, snapshot_path: str = SNAPSHOT_PATH):
+        
+        self.snapshot_path = snapshot_path
+        self.db = None
+        self.retired = None
+        self.identity = None
+        self.lock = asyncio.Lock()
+        self.on_switch: Optional[Callable[[Set[str]], None]] = None
+    
+    async def connection(self) -> Optional[aiosqlite.Connection]:
+        """Get a connection to the newest snapshot, reopening if it was replaced"""
+        
+        try:
+            stat = os.stat(self.snapshot_path)
+        except FileNotFoundError:
+            return self.db
+        
+        identity = (stat.st_ino, stat.st_mtime_ns)
+        
+        if identity == self.identity:
+            return self.db
+        
+        async with self.lock:
+            if identity == self.identity:
+                return self.db
+            
+            try:
+                db = await aiosqlite.connect(f"file:{self.snapshot_path}?mode=ro&immutable=1", uri=True)
+                await db.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+                
+                changed = await self.get_changed_cards(db)
+            
+            except Exception as e:
+                logger.error(f"Error opening snapshot {self.snapshot_path}: {e}")
+                return self.db
+            
+            # requests may still be reading the previous snapshot, so it is
+            # only closed once the next one replaces it
+            if self.retired is not None:
+                await self.retired.close()
+            
+            self.retired, self.db, self.identity = self.db, db, identity
+            
+            logger.info(f"Switched to snapshot {self.snapshot_path} - {len(changed)} changed cards")
+        
+        if self.on_switch is not None and changed:
+            self.on_switch(changed)
+        
+        return self.db
+    
+    async def get_changed_cards(self, db: aiosqlite.Connection) -> Set[str]:
+        """Get the cards whose listings changed in the run that published a snapshot"""
+        
+        try:
+            async with db.execute("SELECT card_id FROM changed_cards") as cursor:
+                rows = await cursor.fetchall()
+        
+        except sqlite3.OperationalError:
+            # snapshots published before changed cards were recorded
+            return set()
+        
+        return {row[0] for row in rows}
+    
+    async def close(self):
+        """Close the current and retired snapshot connections"""
+        
+        async with self.lock:
+            for db in (self.db, self.retired):
+                if db is not None:
+                    await db.close()
+            
+            self.db, self.retired, self.identity = None, None, None
+    
+    async def get_all_cards(self) -> Optional[Dict[str, str]]:
+        """Get all cards as a dictionary {id: name}"""
+        
+        db = await self.connection()
+        
+        if db is None:
+            return None
+        
+        async with db.execute("SELECT id, name FROM cards") as cursor:
+            rows = await cursor.fetchall()
+            
+            return {row[0]: row[1] for row in rows}
+    
+    async def get_card_averages(self, card_id: str) -> Optional[Dict[str, float]]:
+        """Get the precomputed price averages for a card"""
+        
+        db = await self.connection()
+        
+        if db is None:
+            return None
+        
+        async with db.execute("SELECT week, month, year FROM card_stats WHERE card_id = ?", (card_id,)) as cursor:
+            row = await cursor.fetchone()
+        
+        if row is None:
+            return None
+        
+        return {'week': row[0], 'month': row[1], 'year': row[2]}
\ No newline at end of file
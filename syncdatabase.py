@@ -78,4 +78,18 @@ class SyncCardDatabase:
             cursor = db.execute("SELECT id, name FROM cards")
             rows = cursor.fetchall()
             
-            return {row[0]: row[1] for row in rows}
\ No newline at end of file
+            return {row[0]: row[1] for row in rows}
+    
+    def compact(self) -> bool:
+        """Reclaim free pages and refresh query planner statistics"""
+        
+        try:
+            with sqlite3.connect(self.db_path) as db:
+                db.execute("VACUUM")
+                db.execute("ANALYZE")
+                
+                return True
+            
+        except Exception as e:
+            logger.error(f"Error compacting database {self.db_path}: {e}")
+            return False
\ No newline at end of file
@@ -5,17 +5,26 @@ License: CC BY-NC 4.0 (https://creativecommons.org/licenses/by-nc/4.0/)
 This work is licensed under a Creative Commons Attribution-NonCommercial 4.0 International License.
 """
 
+from snapshot import SnapshotReader
 from database import CardDatabase
 from typing import Optional, Dict
 
+snapshot = SnapshotReader()
+
 async def get_card_list() -> Optional[Dict[str, str]]:
-    """Get list of all cards from database"""
+    """Get list of all cards, from the snapshot when one has been published"""
+    
+    if await snapshot.connection() is not None:
+        return await snapshot.get_all_cards()
     
     db = CardDatabase()
     return await db.get_all_cards()
 
 async def get_card_averages(card_id: str) -> Optional[Dict[str, float]]:
-    """Get price averages for a specific card"""
+    """Get price averages for a specific card, from the snapshot when one has been published"""
+    
+    if await snapshot.connection() is not None:
+        return await snapshot.get_card_averages(card_id)
     
     db = CardDatabase()
     return await db.get_card_averages(card_id)
\ No newline at end of file
@@ -5,17 +5,39 @@ License: CC BY-NC 4.0 (https://creativecommons.org/licenses/by-nc/4.0/)
 This work is licensed under a Creative Commons Attribution-NonCommercial 4.0 International License.
 """
 
-from util import get_card_list, get_card_averages
+from util import get_card_list, get_card_averages, snapshot
 from logging_setup import setup_logging
-from quart import Quart, jsonify
+from notify import ChangeFeed, encode_event, NOTIFY_PORT
+from quart import Quart, jsonify, make_response, request
 import logging
 
-setup_logging()
-
 logger = logging.getLogger('web')
 
 app = Quart('cardstatx')
 
+# Pushed stats are read from the snapshot like every other endpoint, so
+# streams only update once an ingest run has published a new one. Each
+# snapshot lists the cards its run changed, which are pushed when it opens.
+feed = ChangeFeed(get_card_averages, snapshot.connection)
+snapshot.on_switch = feed.announce
+
+MAX_STREAM_CARDS = 100
+
+KEEPALIVE_SECONDS = 15
+
+@app.before_serving
+async def start_feed():
+    # push updates are optional, so the API still serves if the port is taken
+    await feed.start(port=app.config.get('NOTIFY_PORT', NOTIFY_PORT))
+
+@app.after_serving
+async def stop_feed():
+    feed.stop()
+
+@app.after_serving
+async def close_snapshot():
+    await snapshot.close()
+
 @app.route('/')
 async def hello():
     return 'Hello, World!'
@@ -38,5 +60,57 @@ async def api_stats_average(card_id: str):
     
     return jsonify(averages)
 
+@app.route('/api/stream')
+async def api_stream():
+    card_ids = {card_id.strip() for card_id in request.args.get('cards', '').split(',') if card_id.strip()}
+    
+    if not card_ids:
+        return jsonify({"error": "No cards requested"}), 400
+    
+    if len(card_ids) > MAX_STREAM_CARDS:
+        return jsonify({"error": f"At most {MAX_STREAM_CARDS} cards per stream"}), 400
+    
+    async def events():
+        # subscribing inside the try means a client that disconnects before
+        # the body starts never leaves a subscription behind
+        subscription = None
+        
+        try:
+            subscription = feed.subscribe(card_ids)
+            
+            for card_id in card_ids:
+                averages = await get_card_averages(card_id)
+                if averages is not None:
+                    yield encode_event(card_id, averages).encode()
+            
+            while True:
+                batch = await subscription.next(timeout=KEEPALIVE_SECONDS)
+                
+                if not batch:
+                    yield b": keepalive\n\n"
+                    continue
+                
+                yield ''.join(batch).encode()
+        
+        finally:
+            if subscription is not None:
+                feed.unsubscribe(subscription)
+    
+    response = await make_response(events(), {
+        'Content-Type': 'text/event-stream',
+        'Cache-Control': 'no-cache',
+    })
+    response.timeout = None
+    
+    return response
+
+def main(host: str = '127.0.0.1', port: int = 5000, debug: bool = True, notify_port: int = NOTIFY_PORT):
+    
+    setup_logging()
+    
+    app.config['NOTIFY_PORT'] = notify_port
+    
+    app.run(host=host, port=port, debug=debug)
+
 if __name__ == '__main__':
-    app.run(debug=True, port=5000)
\ No newline at end of file
+    main()
\ No newline at end of file